@@ -0,0 +1,22 @@
+"""
+Pytest fixtures shared across the Registrar test suite.
+"""
+import logging
+
+import moto
+import pytest
+
+
+@pytest.fixture(scope='session')
+def s3_mock():
+    """
+    Keep a single moto S3 mock running for the whole test session.
+
+    With pytest-xdist this is started once per worker. Test classes are
+    expected to create and remove their own buckets on top of it.
+    """
+    # Suppress egregious boto/moto DEBUG logging.
+    for logger_name in ['boto3', 'botocore', 's3transfer']:
+        logging.getLogger(logger_name).setLevel(logging.INFO)
+    with moto.mock_s3() as mock:
+        yield mock
@@ -8,6 +8,7 @@ from unittest import mock
 
 import jwt
 from django.conf import settings
+from rest_framework.test import APIRequestFactory, force_authenticate
 
 from registrar.apps.api.constants import TRACKING_CATEGORY
 from registrar.apps.core.auth_checks import get_user_organizations
@@ -149,6 +150,8 @@ class AuthRequestMixin(JwtMixin):
     method = None  # Used in test_unauthenticated
     path = None  # Used in test_unauthenticated
 
+    _jwt_headers = None  # JWT auth headers for the current test, keyed by user
+
     def test_unauthenticated(self):
         if isinstance(self.method, str):
             methods = [self.method]
@@ -189,6 +192,20 @@ class AuthRequestMixin(JwtMixin):
         """
         return self.request('delete', path, user)
 
+    def get_jwt_header(self, user):
+        """
+        Get a JWT auth header for the given user.
+
+        The header is generated on the user's first request in the current
+        test and reused for the rest of it.
+        """
+        if self._jwt_headers is None:
+            self._jwt_headers = {}
+        key = (user.pk, user.is_staff)
+        if key not in self._jwt_headers:
+            self._jwt_headers[key] = self.generate_jwt_header(user, admin=user.is_staff)
+        return self._jwt_headers[key]
+
     def request(self, method, path, user, data=None, file=None):
         """
         Perform an HTTP request of the given method.
@@ -197,9 +214,7 @@ class AuthRequestMixin(JwtMixin):
         """
         kwargs = {'follow': True}
         if user:
-            kwargs['HTTP_AUTHORIZATION'] = self.generate_jwt_header(
-                user, admin=user.is_staff,
-            )
+            kwargs['HTTP_AUTHORIZATION'] = self.get_jwt_header(user)
         if data:
             kwargs['data'] = json.dumps(data)
             kwargs['content_type'] = 'application/json'
@@ -208,11 +223,28 @@ class AuthRequestMixin(JwtMixin):
                 'file': file
             }
             kwargs['format'] = 'multipart'
+        return getattr(self.client, method.lower())(self.absolute_path(path), **kwargs)
+
+    def call_view(self, view_class, path, user, **url_kwargs):
+        """
+        Perform a GET on the given path by calling view_class directly.
+
+        The user is force-authenticated and the request bypasses URL
+        resolution, the middleware stack, and JWT authentication, so this is
+        only suitable for tests of the view's own logic. ``url_kwargs`` are
+        passed to the view as its URL parameters.
+        """
+        request = APIRequestFactory().get(self.absolute_path(path))
+        force_authenticate(request, user=user)
+        return view_class.as_view()(request, **url_kwargs)
+
+    def absolute_path(self, path):
+        """
+        Prepend ``api_root`` to the given path, unless it is already absolute.
+        """
         path_is_absolute = (
             path.startswith('http://') or
             path.startswith('https://') or
             path.startswith('/')
         )
-        if not path_is_absolute:
-            path = self.api_root + path
-        return getattr(self.client, method.lower())(path, **kwargs)
+        return path if path_is_absolute else self.api_root + path
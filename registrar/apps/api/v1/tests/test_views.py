@@ -1,16 +1,16 @@
 """ Tests for API views. """
 import csv
 import json
-import logging
 import uuid
 from contextlib import contextmanager
 from io import StringIO
 from posixpath import join as urljoin
+from secrets import token_hex
 from unittest import mock
 
 import boto3
 import ddt
-import moto
+import pytest
 import requests
 import responses
 from celery import shared_task
@@ -44,6 +44,7 @@ from registrar.apps.core.jobs import (
 from registrar.apps.core.models import (
     Organization,
     OrganizationGroup,
+    Program,
     ProgramOrganizationGroup,
     User,
 )
@@ -68,12 +69,39 @@ from registrar.apps.enrollments.lms_interop import (
 from registrar.apps.enrollments.tasks import lms
 from registrar.apps.grades.constants import GradeReadStatus
 
-from ..views import CourseRunEnrollmentUploadView, ProgramEnrollmentUploadView
+from ..views import (
+    CourseRunEnrollmentUploadView,
+    ProgramEnrollmentUploadView,
+    ProgramListView,
+    ProgramRetrieveView,
+)
 
 
 ACTIVE_CURRICULUM_UUID = '77777777-4444-2222-1111-000000000000'
 INACTIVE_CURRICULUM_UUID = '66666666-4444-2222-1111-000000000000'
 
+# Program enrollment write payloads shared across tests; never mutate these.
+_ENROLL_001 = {'status': 'enrolled', 'student_key': '001'}
+_ENROLL_002 = {'status': 'enrolled', 'student_key': '002'}
+_PENDING_003 = {'status': 'pending', 'student_key': '003'}
+_INVALID_003 = {'status': 'not_a_valid_value', 'student_key': '003'}
+
+_RESPONSES_METHODS = {
+    'GET': responses.GET,
+    'POST': responses.POST,
+    'PATCH': responses.PATCH,
+    'PUT': responses.PUT,
+    'DELETE': responses.DELETE,
+}
+
+# Organization roles granted to the "admins" and "users" groups in RegistrarAPITestCase.
+_RW_ROLE = perms.OrganizationReadWriteEnrollmentsRole.name
+_READ_ROLE = perms.OrganizationReadMetadataRole.name
+
+_FAKER = Faker()
+# Payload posted by _succeeding_job; its content is irrelevant, so build it once.
+_FAKE_PAYLOAD_JSON = json.dumps(_FAKER.pystruct(count=20, value_types=(str, int, bool)))
+
 
 @contextmanager
 def activate_waffle_flag(flag_name, group):
@@ -107,15 +135,7 @@ class RegistrarAPITestCase(TrackTestMixin, APITestCase):
         #  - "ops" have enrollment read access & metadata read access
         #  - "users" have metadata read access
 
-        cls.stem_org = OrganizationFactory(name='STEM Institute')
-        cls.cs_program = ProgramFactory(
-            key="masters-in-cs",
-            managing_organization=cls.stem_org,
-        )
-        cls.mech_program = ProgramFactory(
-            key="masters-in-me",
-            managing_organization=cls.stem_org,
-        )
+        cls._bulk_create_orgs_and_programs()
 
         cls.stem_admin = UserFactory(username='stem-institute-admin')
         cls.stem_user = UserFactory(username='stem-institute-user')
@@ -126,7 +146,7 @@ class RegistrarAPITestCase(TrackTestMixin, APITestCase):
         cls.stem_admin_group = OrganizationGroupFactory(
             name='stem-admins',
             organization=cls.stem_org,
-            role=perms.OrganizationReadWriteEnrollmentsRole.name
+            role=_RW_ROLE
         )
         cls.stem_op_group = OrganizationGroupFactory(
             name='stem-ops',
@@ -136,26 +156,14 @@ class RegistrarAPITestCase(TrackTestMixin, APITestCase):
         cls.stem_user_group = OrganizationGroupFactory(
             name='stem-users',
             organization=cls.stem_org,
-            role=perms.OrganizationReadMetadataRole.name
-        )
-        cls.stem_admin.groups.add(cls.stem_admin_group)
-        cls.stem_user.groups.add(cls.stem_user_group)
-
-        cls.hum_org = OrganizationFactory(name='Humanities College')
-        cls.phil_program = ProgramFactory(
-            key="masters-in-philosophy",
-            managing_organization=cls.hum_org,
-        )
-        cls.english_program = ProgramFactory(
-            key="masters-in-english",
-            managing_organization=cls.hum_org,
+            role=_READ_ROLE
         )
 
         cls.hum_admin = UserFactory(username='humanities-college-admin')
         cls.hum_admin_group = OrganizationGroupFactory(
             name='hum-admins',
             organization=cls.hum_org,
-            role=perms.OrganizationReadWriteEnrollmentsRole.name
+            role=_RW_ROLE
         )
         cls.hum_op_group = OrganizationGroupFactory(
             name='hum-ops',
@@ -165,15 +173,13 @@ class RegistrarAPITestCase(TrackTestMixin, APITestCase):
         cls.hum_user_group = OrganizationGroupFactory(
             name='hum-users',
             organization=cls.hum_org,
-            role=perms.OrganizationReadMetadataRole.name
+            role=_READ_ROLE
         )
         cls.hum_data_op_group = OrganizationGroupFactory(
             name='hum-data-ops',
             organization=cls.hum_org,
             role=perms.OrganizationReadReportRole.name
         )
-        cls.hum_admin.groups.add(cls.hum_admin_group)
-        cls.hum_admin.groups.add(cls.hum_data_op_group)
 
         cls.program_user = UserFactory(username='english-program-user')
         cls.program_group = ProgramOrganizationGroupFactory(
@@ -181,7 +187,6 @@ class RegistrarAPITestCase(TrackTestMixin, APITestCase):
             program=cls.english_program,
             role=perms.ProgramReadMetadataRole.name
         )
-        cls.program_user.groups.add(cls.program_group)
 
         cls.cs_program_admin = UserFactory(username='cs-program-admin')
         cls.cs_program_admin_group = ProgramOrganizationGroupFactory(
@@ -189,17 +194,64 @@ class RegistrarAPITestCase(TrackTestMixin, APITestCase):
             program=cls.cs_program,
             role=perms.ProgramReadWriteEnrollmentsRole.name
         )
-        cls.cs_program_admin.groups.add(cls.cs_program_admin_group)
+
+        user_group_memberships = [
+            (cls.stem_admin, cls.stem_admin_group),
+            (cls.stem_user, cls.stem_user_group),
+            (cls.hum_admin, cls.hum_admin_group),
+            (cls.hum_admin, cls.hum_data_op_group),
+            (cls.program_user, cls.program_group),
+            (cls.cs_program_admin, cls.cs_program_admin_group),
+        ]
+        User.groups.through.objects.bulk_create([
+            User.groups.through(user=user, group=group)
+            for user, group in user_group_memberships
+        ])
+
+    @classmethod
+    def _bulk_create_orgs_and_programs(cls):
+        """
+        Create the STEM and Humanities organizations and their programs
+        with a single INSERT per model.
+        """
+        stem_org = OrganizationFactory.build(name='STEM Institute')
+        hum_org = OrganizationFactory.build(name='Humanities College')
+        Organization.objects.bulk_create([stem_org, hum_org])
+        # bulk_create does not set primary keys on SQLite, so read the rows back.
+        orgs = Organization.objects.in_bulk([stem_org.key, hum_org.key], field_name='key')
+        cls.stem_org = orgs[stem_org.key]
+        cls.hum_org = orgs[hum_org.key]
+
+        program_orgs = [
+            ('masters-in-cs', cls.stem_org),
+            ('masters-in-me', cls.stem_org),
+            ('masters-in-philosophy', cls.hum_org),
+            ('masters-in-english', cls.hum_org),
+        ]
+        Program.objects.bulk_create([
+            ProgramFactory.build(key=key, managing_organization=org)
+            for key, org in program_orgs
+        ])
+        programs = Program.objects.in_bulk([key for key, _ in program_orgs], field_name='key')
+        cls.cs_program = programs['masters-in-cs']
+        cls.mech_program = programs['masters-in-me']
+        cls.phil_program = programs['masters-in-philosophy']
+        cls.english_program = programs['masters-in-english']
 
     def setUp(self):
         super().setUp()
         self._add_programs_to_cache()
 
     def mock_api_response(self, url, response_data, method='GET', response_code=200):
+        """
+        Mock a JSON API response. Strings and bytes are used as the body as-is.
+        """
+        if not isinstance(response_data, (str, bytes)):
+            response_data = json.dumps(response_data)
         responses.add(
-            getattr(responses, method.upper()),
+            _RESPONSES_METHODS[method.upper()],
             url,
-            body=json.dumps(response_data),
+            body=response_data,
             content_type='application/json',
             status=response_code
         )
@@ -230,12 +282,13 @@ class RegistrarAPITestCase(TrackTestMixin, APITestCase):
         cache.set(cache_key, mock_program_details)
 
 
+@pytest.mark.usefixtures('s3_mock')
 class S3MockMixin(S3MockEnvVarsMixin):
     """
     Mixin for classes that need to access S3 resources.
 
-    Enables S3 mock and creates default bucket before tests.
-    Disables S3 mock afterwards.
+    Relies on the session-wide `s3_mock` fixture for the S3 mock itself.
+    Creates the default bucket before tests and deletes it afterwards.
 
     `s3_bucket` class variable specifies which bucket to use.
     Defaults to settings.REGISTRAR_BUCKET.
@@ -245,24 +298,40 @@ class S3MockMixin(S3MockEnvVarsMixin):
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
-        # Suppress egregious boto/moto DEBUG logging.
-        for logger_name in ['boto3', 'botocore', 's3transfer']:
-            logging.getLogger(logger_name).setLevel(logging.INFO)
-        cls._s3_mock = moto.mock_s3()
-        cls._s3_mock.start()
         bucket_region = 'us-west-1'
         conn = boto3.resource('s3', region_name=bucket_region)
-        conn.create_bucket(
+        cls._bucket = conn.create_bucket(
             Bucket=cls.s3_bucket,
             CreateBucketConfiguration={'LocationConstraint': bucket_region},
         )
 
     @classmethod
     def tearDownClass(cls):
-        cls._s3_mock.stop()
+        cls._bucket.objects.all().delete()
+        cls._bucket.delete()
         super().tearDownClass()
 
 
+class ResponsesMockMixin:
+    """
+    Mixin for classes whose tests mock out HTTP calls with `responses`.
+
+    Keeps the default `responses` mock started for each test and resets it
+    afterwards, rather than having every test re-activate it through
+    `@responses.activate`.
+
+    Registered responses are deliberately not shared across tests: each test
+    registers the LMS response (status and body) it needs, so that nothing a
+    test registers can leak into the next one.
+    """
+
+    def setUp(self):
+        super().setUp()
+        responses.start()
+        self.addCleanup(responses.reset)
+        self.addCleanup(responses.stop)
+
+
 @ddt.ddt
 class ViewMethodNotSupportedTests(RegistrarAPITestCase, AuthRequestMixin):
     """ Tests for the case if user requested a not supported HTTP method """
@@ -304,12 +373,11 @@ class ProgramListViewTests(RegistrarAPITestCase, AuthRequestMixin):
 
     def test_all_programs_200(self):
         with self.assert_tracking(user=self.edx_admin):
-            response = self.get('programs', self.edx_admin)
+            response = self.call_view(ProgramListView, 'programs', self.edx_admin)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data), 4)
-        response_programs = sorted(response.data, key=lambda p: p['program_key'])
         self.assertListEqual(
-            response_programs,
+            response.data,
             [
                 {
                     'program_key': 'masters-in-cs',
@@ -344,12 +412,11 @@ class ProgramListViewTests(RegistrarAPITestCase, AuthRequestMixin):
 
     def test_partial_programs_200(self):
         with self.assert_tracking(user=self.program_user):
-            response = self.get('programs', self.program_user)
+            response = self.call_view(ProgramListView, 'programs', self.program_user)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data), 1)
-        response_programs = sorted(response.data, key=lambda p: p['program_key'])
         self.assertListEqual(
-            response_programs,
+            response.data,
             [
                 {
                     'program_key': 'masters-in-english',
@@ -363,12 +430,11 @@ class ProgramListViewTests(RegistrarAPITestCase, AuthRequestMixin):
 
     def test_program_title_filter(self):
         with self.assert_tracking(user=self.edx_admin):
-            response = self.get('programs?program_title=philosophy', self.edx_admin)
+            response = self.call_view(ProgramListView, 'programs?program_title=philosophy', self.edx_admin)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data), 1)
-        response_programs = sorted(response.data, key=lambda p: p['program_key'])
         self.assertListEqual(
-            response_programs,
+            response.data,
             [
                 {
                     'program_key': 'masters-in-philosophy',
@@ -382,12 +448,11 @@ class ProgramListViewTests(RegistrarAPITestCase, AuthRequestMixin):
 
     def test_title_filter_empty(self):
         with self.assert_tracking(user=self.edx_admin):
-            response = self.get('programs?program_title=', self.edx_admin)
+            response = self.call_view(ProgramListView, 'programs?program_title=', self.edx_admin)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data), 4)
-        response_programs = sorted(response.data, key=lambda p: p['program_key'])
         self.assertListEqual(
-            response_programs,
+            response.data,
             [
                 {
                     'program_key': 'masters-in-cs',
@@ -422,7 +487,7 @@ class ProgramListViewTests(RegistrarAPITestCase, AuthRequestMixin):
 
     def test_title_filter_invalid(self):
         with self.assert_tracking(user=self.edx_admin):
-            response = self.get('programs?program_title=invalidtitle', self.edx_admin)
+            response = self.call_view(ProgramListView, 'programs?program_title=invalidtitle', self.edx_admin)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data), 0)
         self.assertListEqual(response.data, [])
@@ -438,7 +503,7 @@ class ProgramListViewTests(RegistrarAPITestCase, AuthRequestMixin):
         we only look up programs details (from the Discovery service or its cache)
         for that singular program.
         """
-        response = self.get('programs', self.program_user)
+        response = self.call_view(ProgramListView, 'programs', self.program_user)
         assert response.status_code == 200
         assert len(response.data) == 1
         call_uuids = {
@@ -590,7 +655,7 @@ class ProgramListViewTests(RegistrarAPITestCase, AuthRequestMixin):
                 status_code=expected_status,
                 **tracking_kwargs
         ):
-            response = self.get('programs?' + querystring, user)
+            response = self.call_view(ProgramListView, 'programs?' + querystring, user)
         self.assertEqual(response.status_code, expected_status)
 
         if expected_status == 200:  # pragma: no branch
@@ -666,7 +731,7 @@ class ProgramListViewTests(RegistrarAPITestCase, AuthRequestMixin):
                 status_code=200,
                 permission_filter=perm_filter,
         ):
-            response = self.get('programs?user_has_perm=' + perm_filter, user)
+            response = self.call_view(ProgramListView, 'programs?user_has_perm=' + perm_filter, user)
         self.assertEqual(response.status_code, 200)
         returned_program_keys = [program['program_key'] for program in response.data]
         for expected_key in expected_programs:
@@ -705,14 +770,14 @@ class ProgramListViewTests(RegistrarAPITestCase, AuthRequestMixin):
                 status_code=404,
                 **tracking_kwargs
         ):
-            response = self.get('programs?' + querystring, self.stem_admin)
+            response = self.call_view(ProgramListView, 'programs?' + querystring, self.stem_admin)
         self.assertEqual(response.status_code, 404)
 
     @mock.patch.object(Organization.objects, 'get', wraps=Organization.objects.get)
     def test_org_property_caching(self, get_org_wrapper):
         # If the 'managing_organization' property is not cached, a single
         # call to this endpoint would cause multiple Organization queries
-        response = self.get("programs?org=stem-institute", self.stem_admin)
+        response = self.call_view(ProgramListView, "programs?org=stem-institute", self.stem_admin)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.data), 2)
         get_org_wrapper.assert_called_once()
@@ -740,7 +805,9 @@ class ProgramRetrieveViewTests(RegistrarAPITestCase, AuthRequestMixin):
     def test_get_program(self, username, api_permissions):
         user = User.objects.get(username=username)
         with self.assert_tracking(user=user, program_key='masters-in-english'):
-            response = self.get('programs/masters-in-english', user)
+            response = self.call_view(
+                ProgramRetrieveView, 'programs/masters-in-english', user, program_key='masters-in-english'
+            )
         self.assertEqual(response.status_code, 200)
         response.data['permissions'] = sorted(response.data['permissions'])
         api_permissions = sorted(api_permissions)
@@ -761,7 +828,9 @@ class ProgramRetrieveViewTests(RegistrarAPITestCase, AuthRequestMixin):
                 program_key='masters-in-english',
                 missing_permissions=[perms.API_READ_METADATA.name],
         ):
-            response = self.get('programs/masters-in-english', self.stem_admin)
+            response = self.call_view(
+                ProgramRetrieveView, 'programs/masters-in-english', self.stem_admin, program_key='masters-in-english'
+            )
         self.assertEqual(response.status_code, 403)
 
     def test_program_not_found(self):
@@ -770,11 +839,12 @@ class ProgramRetrieveViewTests(RegistrarAPITestCase, AuthRequestMixin):
                 program_key='masters-in-polysci',
                 failure='program_not_found',
         ):
-            response = self.get('programs/masters-in-polysci', self.stem_admin)
+            response = self.call_view(
+                ProgramRetrieveView, 'programs/masters-in-polysci', self.stem_admin, program_key='masters-in-polysci'
+            )
         self.assertEqual(response.status_code, 404)
 
 
-@ddt.ddt
 class ProgramCourseListViewTests(RegistrarAPITestCase, AuthRequestMixin):
     """ Tests for the /api/v1/programs/{program_key}/courses endpoint """
 
@@ -783,16 +853,22 @@ class ProgramCourseListViewTests(RegistrarAPITestCase, AuthRequestMixin):
     event = 'registrar.v1.get_program_courses'
 
     program_uuid = str(uuid.uuid4())
-    program_title = Faker().sentence(nb_words=6)
-    program_url = Faker().uri()
+    program_title = _FAKER.sentence(nb_words=6)
+    program_url = _FAKER.uri()
     program_type = 'Masters'
 
-    @ddt.data(True, False)
     @mock_oauth_login
     @responses.activate
-    def test_get_program_courses(self, is_staff):
-        user = self.edx_admin if is_staff else self.hum_admin
+    def test_get_program_courses(self):
+        self._test_get_program_courses(self.hum_admin)
+
+    @mock_oauth_login
+    @responses.activate
+    def test_get_program_courses_as_staff(self):
+        self._test_get_program_courses(self.edx_admin)
 
+    def _test_get_program_courses(self, user):
+        """ Assert that the given user can list the courses of the English program. """
         mock_program_details = {
             "title": self.program_title,
             "marketing_url": self.program_url,
@@ -976,28 +1052,40 @@ class ProgramCourseListViewTests(RegistrarAPITestCase, AuthRequestMixin):
 
 
 @ddt.ddt
-class ProgramEnrollmentWriteMixin:
+class ProgramEnrollmentWriteMixin(ResponsesMockMixin):
     """ Test write requests to the /api/v1/programs/{program_key}/enrollments endpoint """
     path = 'programs/masters-in-english/enrollments'
+    cs_path = 'programs/masters-in-cs/enrollments/'
+    mock_program_details = {
+        'curricula': [
+            {'uuid': INACTIVE_CURRICULUM_UUID, 'is_active': False},
+            {'uuid': ACTIVE_CURRICULUM_UUID, 'is_active': True}
+        ],
+        'type': 'Masters',
+    }
+    program_no_curricula = {
+        'curricula': [],
+        'type': 'Masters',
+    }
 
     @classmethod
-    def setUpTestData(cls):   # pylint: disable=missing-function-docstring
+    def setUpTestData(cls):
         super().setUpTestData()
         program_uuid = cls.cs_program.discovery_uuid
-        cls.mock_program_details = {
-            'curricula': [
-                {'uuid': INACTIVE_CURRICULUM_UUID, 'is_active': False},
-                {'uuid': ACTIVE_CURRICULUM_UUID, 'is_active': True}
-            ],
-            'type': 'Masters',
-        }
-        cls.program_no_curricula = {
-            'curricula': [],
-            'type': 'Masters',
-        }
         cls.lms_request_url = urljoin(
-            settings.LMS_BASE_URL, 'api/program_enrollments/v1/programs/{}/enrollments/'
-        ).format(program_uuid)
+            settings.LMS_BASE_URL, f'api/program_enrollments/v1/programs/{program_uuid}/enrollments/'
+        )
+
+    def setUp(self):
+        super().setUp()
+        # Passes through to the real Discovery cache lookup until a test sets return_value.
+        discovery_patcher = mock.patch.object(
+            ProgramDetails,
+            'get_raw_data_for_program',
+            wraps=ProgramDetails.get_raw_data_for_program,
+        )
+        self.mock_discovery = discovery_patcher.start()
+        self.addCleanup(discovery_patcher.stop)
 
     def mock_enrollments_response(self, method, expected_response, response_code=200):
         self.mock_api_response(self.lms_request_url, expected_response, method=method, response_code=response_code)
@@ -1005,7 +1093,7 @@ class ProgramEnrollmentWriteMixin:
     def student_enrollment(self, status, student_key=None):
         return {
             'status': status,
-            'student_key': student_key or uuid.uuid4().hex[0:10]
+            'student_key': student_key or token_hex(5)
         }
 
     def test_program_unauthorized_at_organization(self):
@@ -1020,7 +1108,7 @@ class ProgramEnrollmentWriteMixin:
         ):
             response = self.request(
                 self.method,
-                'programs/masters-in-cs/enrollments/',
+                self.cs_path,
                 self.hum_admin,
                 req_data,
             )
@@ -1037,7 +1125,7 @@ class ProgramEnrollmentWriteMixin:
         ):
             response = self.request(
                 self.method,
-                'programs/masters-in-cs/enrollments/',
+                self.cs_path,
                 self.stem_user,
                 req_data,
             )
@@ -1074,7 +1162,6 @@ class ProgramEnrollmentWriteMixin:
         self.assertEqual(response.status_code, 403)
 
     @mock_oauth_login
-    @responses.activate
     def test_successful_program_enrollment_write(self):
         expected_lms_response = {
             '001': 'enrolled',
@@ -1084,19 +1171,19 @@ class ProgramEnrollmentWriteMixin:
         self.mock_enrollments_response(self.method, expected_lms_response)
 
         req_data = [
-            self.student_enrollment('enrolled', '001'),
-            self.student_enrollment('enrolled', '002'),
-            self.student_enrollment('pending', '003'),
+            _ENROLL_001,
+            _ENROLL_002,
+            _PENDING_003,
         ]
 
+        self.mock_discovery.return_value = self.mock_program_details
         with self.assert_tracking(user=self.stem_admin, program_key='masters-in-cs'):
-            with patch_discovery_program_details(self.mock_program_details):
-                response = self.request(
-                    self.method,
-                    'programs/masters-in-cs/enrollments/',
-                    self.stem_admin,
-                    req_data,
-                )
+            response = self.request(
+                self.method,
+                self.cs_path,
+                self.stem_admin,
+                req_data,
+            )
 
         lms_request_body = json.loads(responses.calls[-1].request.body.decode('utf-8'))
         self.assertCountEqual(lms_request_body, [
@@ -1120,7 +1207,6 @@ class ProgramEnrollmentWriteMixin:
         self.assertDictEqual(response.data, expected_lms_response)
 
     @mock_oauth_login
-    @responses.activate
     def test_backend_unprocessable_response(self):
         expected_lms_response = {
             '001': 'conflict',
@@ -1130,28 +1216,27 @@ class ProgramEnrollmentWriteMixin:
         self.mock_enrollments_response(self.method, expected_lms_response, response_code=422)
 
         req_data = [
-            self.student_enrollment('enrolled', '001'),
-            self.student_enrollment('enrolled', '002'),
-            self.student_enrollment('pending', '003'),
+            _ENROLL_001,
+            _ENROLL_002,
+            _PENDING_003,
         ]
 
+        self.mock_discovery.return_value = self.mock_program_details
         with self.assert_tracking(
                 user=self.stem_admin,
                 program_key='masters-in-cs',
                 failure='unprocessable_entity',
         ):
-            with patch_discovery_program_details(self.mock_program_details):
-                response = self.request(
-                    self.method,
-                    'programs/masters-in-cs/enrollments/',
-                    self.stem_admin,
-                    req_data,
-                )
+            response = self.request(
+                self.method,
+                self.cs_path,
+                self.stem_admin,
+                req_data,
+            )
         self.assertEqual(response.status_code, 422)
         self.assertEqual(response.data, expected_lms_response)
 
     @mock_oauth_login
-    @responses.activate
     def test_backend_multi_status_response(self):
         expected_lms_response = {
             '001': 'enrolled',
@@ -1161,27 +1246,26 @@ class ProgramEnrollmentWriteMixin:
         self.mock_enrollments_response(self.method, expected_lms_response, response_code=207)
 
         req_data = [
-            self.student_enrollment('enrolled', '001'),
-            self.student_enrollment('enrolled', '002'),
-            self.student_enrollment('not_a_valid_value', '003'),
+            _ENROLL_001,
+            _ENROLL_002,
+            _INVALID_003,
         ]
+        self.mock_discovery.return_value = self.mock_program_details
         with self.assert_tracking(
                 user=self.stem_admin,
                 program_key='masters-in-cs',
                 status_code=207,
         ):
-            with patch_discovery_program_details(self.mock_program_details):
-                response = self.request(
-                    self.method,
-                    'programs/masters-in-cs/enrollments/',
-                    self.stem_admin,
-                    req_data,
-                )
+            response = self.request(
+                self.method,
+                self.cs_path,
+                self.stem_admin,
+                req_data,
+            )
         self.assertEqual(response.status_code, 207)
         self.assertDictEqual(response.data, expected_lms_response)
 
     @mock_oauth_login
-    @responses.activate
     @ddt.data(
         (500, 'Internal Server Error'),
         (404, 'Not Found'),
@@ -1193,27 +1277,27 @@ class ProgramEnrollmentWriteMixin:
             self.method, content, response_code=status_code
         )
         req_data = [
-            self.student_enrollment('enrolled', '001'),
-            self.student_enrollment('enrolled', '002'),
-            self.student_enrollment('pending', '003'),
+            _ENROLL_001,
+            _ENROLL_002,
+            _PENDING_003,
         ]
         expected_response_data = {
             '001': 'internal-error',
             '002': 'internal-error',
             '003': 'internal-error',
         }
+        self.mock_discovery.return_value = self.mock_program_details
         with self.assert_tracking(
                 user=self.stem_admin,
                 program_key='masters-in-cs',
                 failure='unprocessable_entity',
         ):
-            with patch_discovery_program_details(self.mock_program_details):
-                response = self.request(
-                    self.method,
-                    'programs/masters-in-cs/enrollments/',
-                    self.stem_admin,
-                    req_data,
-                )
+            response = self.request(
+                self.method,
+                self.cs_path,
+                self.stem_admin,
+                req_data,
+            )
         self.assertEqual(response.status_code, 422)
         self.assertDictEqual(response.data, expected_response_data)
 
@@ -1225,18 +1309,18 @@ class ProgramEnrollmentWriteMixin:
                 program_key='masters-in-cs',
                 failure='request_entity_too_large',
         ):
-            response = self.request(self.method, 'programs/masters-in-cs/enrollments/', self.stem_admin, req_data)
+            response = self.request(self.method, self.cs_path, self.stem_admin, req_data)
         self.assertEqual(response.status_code, 413)
 
     @mock_oauth_login
-    @patch_discovery_program_details({})
     def test_discovery_data_fetch_failed(self):
+        self.mock_discovery.return_value = {}
         req_data = [
-            self.student_enrollment('enrolled', '001'),
+            _ENROLL_001,
         ]
         response = self.request(
             self.method,
-            'programs/masters-in-cs/enrollments/',
+            self.cs_path,
             self.stem_admin,
             req_data,
         )
@@ -1749,9 +1833,8 @@ class JobStatusRetrieveViewTests(S3MockMixin, RegistrarAPITestCase, AuthRequestM
 
 @shared_task(base=UserTask, bind=True)
 def _succeeding_job(self, job_id, user_id, *args, **kwargs):  # pylint: disable=unused-argument
-    """ A job that just succeeds, posting an empty JSON list as its result. """
-    fake_data = Faker().pystruct(count=20, value_types=(str, int, bool))
-    post_job_success(job_id, json.dumps(fake_data), 'json')
+    """ A job that just succeeds, posting a fixed fake JSON payload as its result. """
+    post_job_success(job_id, _FAKE_PAYLOAD_JSON, 'json')
 
 
 @shared_task(base=UserTask, bind=True)
@@ -1761,7 +1844,7 @@ def _failing_job(self, job_id, user_id, fail_message, *args, **kwargs):  # pylin
 
 
 @ddt.ddt
-class ProgramCourseEnrollmentWriteMixin:
+class ProgramCourseEnrollmentWriteMixin(ResponsesMockMixin):
     """ Test write requests to the /api/v1/programs/{program_key}/courses/{course_id}/enrollments/ endpoint """
 
     @classmethod
@@ -1806,7 +1889,7 @@ class ProgramCourseEnrollmentWriteMixin:
     def student_course_enrollment(self, status, student_key=None, course_staff=None):
         return {
             'status': status,
-            'student_key': student_key or uuid.uuid4().hex[0:10],
+            'student_key': student_key or token_hex(5),
             'course_staff': course_staff
         }
 
@@ -1873,7 +1956,6 @@ class ProgramCourseEnrollmentWriteMixin:
         self.assertEqual(response.status_code, 404)
 
     @mock_oauth_login
-    @responses.activate
     def test_course_not_found(self):
         req_data = [
             self.student_course_enrollment('active'),
@@ -1894,7 +1976,6 @@ class ProgramCourseEnrollmentWriteMixin:
         self.assertEqual(response.status_code, 404)
 
     @mock_oauth_login
-    @responses.activate
     @ddt.data(False, True)
     def test_successful_program_course_enrollment_write(self, use_external_course_key):
         course_id = self.external_course_key if use_external_course_key else self.course_id
@@ -1942,7 +2023,6 @@ class ProgramCourseEnrollmentWriteMixin:
         self.assertDictEqual(response.data, expected_lms_response)
 
     @mock_oauth_login
-    @responses.activate
     @ddt.data(False, True)
     def test_successful_update_course_staff_with_organization_group_waffle_enabled(self, use_external_course_key):
         course_id = self.external_course_key if use_external_course_key else self.course_id
@@ -1991,7 +2071,6 @@ class ProgramCourseEnrollmentWriteMixin:
         self.assertDictEqual(response.data, expected_lms_response)
 
     @mock_oauth_login
-    @responses.activate
     @ddt.data(False, True)
     def test_successful_update_course_staff_with_program_group_waffle_enabled(self, use_external_course_key):
         course_id = self.external_course_key if use_external_course_key else self.course_id
@@ -2040,7 +2119,6 @@ class ProgramCourseEnrollmentWriteMixin:
         self.assertDictEqual(response.data, expected_lms_response)
 
     @mock_oauth_login
-    @responses.activate
     @ddt.data(False, True)
     @override_flag('enable_course_role_management', active=False)
     def test_failed_update_course_staff_with_waffle_off(self, use_external_course_key):
@@ -2065,7 +2143,6 @@ class ProgramCourseEnrollmentWriteMixin:
         self.assertEqual(response.status_code, 403)
 
     @mock_oauth_login
-    @responses.activate
     @ddt.data(False, True)
     def test_failed_update_course_staff_with_waffle_enabled_for_another_group(self, use_external_course_key):
         course_id = self.external_course_key if use_external_course_key else self.course_id
@@ -2090,7 +2167,6 @@ class ProgramCourseEnrollmentWriteMixin:
         self.assertEqual(response.status_code, 403)
 
     @mock_oauth_login
-    @responses.activate
     @ddt.data(False, True)
     @override_flag('enable_course_role_management', active=True)
     def test_failed_program_course_enrollment_write_with_bad_course_staff_value(self, use_external_course_key):
@@ -2116,7 +2192,6 @@ class ProgramCourseEnrollmentWriteMixin:
         self.assertEqual(response.status_code, 400)
 
     @mock_oauth_login
-    @responses.activate
     @ddt.data(False, True)
     def test_backend_unprocessable_response(self, use_external_course_key):
         course_id = self.external_course_key if use_external_course_key else self.course_id
@@ -2145,7 +2220,6 @@ class ProgramCourseEnrollmentWriteMixin:
         self.assertEqual(response.data, expected_lms_response)
 
     @mock_oauth_login
-    @responses.activate
     @ddt.data(False, True)
     def test_backend_multi_status_response(self, use_external_course_key):
         course_id = self.external_course_key if use_external_course_key else self.course_id
@@ -2176,7 +2250,6 @@ class ProgramCourseEnrollmentWriteMixin:
         self.assertDictEqual(response.data, expected_lms_response)
 
     @mock_oauth_login
-    @responses.activate
     @ddt.data(
         (500, 'Internal Server Error', True),
         (404, 'Not Found', False),
@@ -2385,22 +2458,22 @@ class JobStatusListView(S3MockMixin, RegistrarAPITestCase, AuthRequestMixin):
 class EnrollmentUploadMixin:
     """ Test CSV upload endpoints """
     method = 'POST'
+    mock_program_details = {
+        'curricula': [
+            {'uuid': INACTIVE_CURRICULUM_UUID, 'is_active': False},
+            {'uuid': ACTIVE_CURRICULUM_UUID, 'is_active': True}
+        ],
+        'type': 'Masters',
+    }
 
     @classmethod
     def setUpTestData(cls):   # pylint: disable=missing-function-docstring
         super().setUpTestData()
 
         program_uuid = cls.cs_program.discovery_uuid
-        cls.mock_program_details = {
-            'curricula': [
-                {'uuid': INACTIVE_CURRICULUM_UUID, 'is_active': False},
-                {'uuid': ACTIVE_CURRICULUM_UUID, 'is_active': True}
-            ],
-            'type': 'Masters',
-        }
         cls.lms_request_url = urljoin(
-            settings.LMS_BASE_URL, 'api/program_enrollments/v1/programs/{}/enrollments/'
-        ).format(program_uuid)
+            settings.LMS_BASE_URL, f'api/program_enrollments/v1/programs/{program_uuid}/enrollments/'
+        )
 
     def _upload_enrollments(self, enrollments, user=None):   # pylint: disable=missing-function-docstring
         upload_file = StringIO(
@@ -2545,7 +2618,11 @@ class EnrollmentUploadMixin:
             )
         self.assertEqual(upload_response.status_code, 400)
 
+    @mock_oauth_login
+    @responses.activate
     def test_extra_columns(self):
+        # The upload job runs eagerly, so mock the LMS write it makes.
+        self.mock_api_response(self.lms_request_url, {'001': 'enrolled'}, method='PUT')
         enrollment = self.build_enrollment('enrolled', '001')
         enrollment['blood_type'] = 'AB-'
         enrollments = [enrollment]
@@ -2567,7 +2644,7 @@ class ProgramEnrollmentUploadTest(EnrollmentUploadMixin, S3MockMixin, RegistrarA
     def build_enrollment(self, status, student_key=None):
         return {
             'status': status,
-            'student_key': student_key or uuid.uuid4().hex[0:10]
+            'student_key': student_key or token_hex(5)
         }
 
 
@@ -2581,8 +2658,8 @@ class CourseEnrollmentUploadTest(EnrollmentUploadMixin, S3MockMixin, RegistrarAP
     def build_enrollment(self, status, student_key=None, course_id=None, course_staff=None):
         enrollment = {
             'status': status,
-            'student_key': student_key or uuid.uuid4().hex[0:10],
-            'course_id': course_id or uuid.uuid4().hex[0:10],
+            'student_key': student_key or token_hex(5),
+            'course_id': course_id or token_hex(5),
         }
         if course_staff is not None:
             enrollment['course_staff'] = course_staff
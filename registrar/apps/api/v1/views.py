@@ -113,7 +113,7 @@ class ProgramListView(TrackViewMixin, ListAPIView):
 
     def get_queryset(self):
         """
-        Get the Programs to be serialized and returned.
+        Get the Programs to be serialized and returned, ordered by key.
 
         Overrides ListAPIView.get_queryset.
         """
@@ -158,7 +158,7 @@ class ProgramListView(TrackViewMixin, ListAPIView):
 
         Calculated and cached once per request.
 
-        Returns: dict[APIPermission: list[Program]]
+        Returns: dict[APIPermission: list[Program]], with each list ordered by key.
         """
         return {
             api_permission: list(
@@ -166,7 +166,7 @@ class ProgramListView(TrackViewMixin, ListAPIView):
                     user=self.request.user,
                     required_api_permission=api_permission,
                     organization_filter=self.organization_filter,
-                )
+                ).order_by('key')
             )
             for api_permission in perms.API_PERMISSIONS
         }
@@ -122,14 +122,19 @@ class ProgramDetailsTestCase(TestCase):
         assert isinstance(loaded_program, ProgramDetails)
         assert loaded_program.uuid == self.program_uuid
         assert loaded_program.raw_data == expected_raw_data
-        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(self._count_discovery_calls(), 1)
 
         # This should used the cached Discovery response.
         reloaded_program = ProgramDetails(self.program_uuid)
         assert isinstance(reloaded_program, ProgramDetails)
         assert reloaded_program.uuid == self.program_uuid
         assert reloaded_program.raw_data == expected_raw_data
-        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(self._count_discovery_calls(), 1)
+
+    def _count_discovery_calls(self):
+        # Whether an OAuth token request is also made depends on whether an
+        # earlier test in this process already cached a token, so ignore it.
+        return sum(call.request.url == self.discovery_url for call in responses.calls)
 
     @patch_discovery_client_get_program(program_from_discovery)
     def test_active_curriculum(self):
@@ -5,6 +5,9 @@ from registrar.settings.base import *
 
 
 # IN-MEMORY TEST DATABASE
+# Each pytest-xdist worker process gets its own private in-memory database,
+# built straight from the models (see --nomigrations in pytest.ini), so no
+# per-worker database names or template databases are needed.
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
@@ -30,7 +33,10 @@ JWT_AUTH['JWT_ISSUERS'] = [{
 }]
 
 # CELERY
+# Run tasks synchronously on the test's own DB connection so plain
+# TestCase transactions (rather than TransactionTestCase flushes) suffice.
 CELERY_TASK_ALWAYS_EAGER = True
+CELERY_TASK_EAGER_PROPAGATES = True
 
 # Results
 CELERY_TASK_IGNORE_RESULT = True